@@ -1,16 +1,39 @@
 """Основная точка входа для SGR Deep Research API сервера."""
 
 import argparse
+import atexit
+import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 import uvicorn
 
 from sgr_deep_research.api.endpoints import app
 
 
+def setup_logging():
+    """Настройка логирования через очередь.
+
+    QueueHandler подставляет аргументы сообщения и рендерит traceback в
+    вызывающем потоке, а итоговое форматирование и блокирующая запись в
+    stderr выполняются фоновым потоком QueueListener.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(lineno)d - %(levelname)s - %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def main():
     """Запуск FastAPI сервера."""
 
+    setup_logging()
     parser = argparse.ArgumentParser(description="SGR Deep Research Server")
     parser.add_argument(
         "--host", type=str, dest="host", default=os.environ.get("HOST", "0.0.0.0"), help="Хост для прослушивания"
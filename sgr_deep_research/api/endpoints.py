@@ -1,8 +1,9 @@
 import asyncio
 import logging
 
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from sgr_deep_research.api.models import (
     AGENT_MODEL_MAPPING,
@@ -41,7 +42,7 @@ async def get_agent_state(agent_id: str):
         agent_id=agent.id,
         task=agent.task,
         sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
+        **agent._context.agent_state(),
     )
 
 
@@ -55,16 +56,22 @@ async def get_agents_list():
     return AgentListResponse(agents=agents_list, total=len(agents_list))
 
 
-@app.get("/v1/models")
-async def get_available_models():
-    """Get list of available agent models."""
-    return {
+# Agent models are fixed at import time, so the listing is serialized only once
+AVAILABLE_MODELS_PAYLOAD = orjson.dumps(
+    {
         "data": [
             {"id": model.value, "object": "model", "created": 1234567890, "owned_by": "sgr-deep-research"}
             for model in AgentModel
         ],
         "object": "list",
     }
+)
+
+
+@app.get("/v1/models")
+async def get_available_models():
+    """Get list of available agent models."""
+    return Response(content=AVAILABLE_MODELS_PAYLOAD, media_type="application/json")
 
 
 def extract_user_content_from_messages(messages):
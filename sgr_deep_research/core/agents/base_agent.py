@@ -1,16 +1,20 @@
-import json
+import asyncio
 import logging
 import os
 import traceback
 import uuid
 from datetime import datetime
+from functools import cache
 from typing import Type
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, pydantic_function_tool
+from openai.lib.streaming.chat import AsyncChatCompletionStream
 from openai.types.chat import ChatCompletionFunctionToolParam
+from pydantic import BaseModel
 
-from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
+from sgr_deep_research.core.models import FINISH_STATES, AgentStatesEnum, ResearchContext
 from sgr_deep_research.core.prompts import PromptLoader
 from sgr_deep_research.core.stream import OpenAIStreamingGenerator
 from sgr_deep_research.core.tools import (
@@ -22,16 +26,16 @@ from sgr_deep_research.core.tools import (
 )
 from sgr_deep_research.settings import get_config
 
-logging.basicConfig(
-    level=logging.INFO,
-    encoding="utf-8",
-    format="%(asctime)s - %(name)s - %(lineno)d - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
-
 config = get_config()
 
 
+def _agent_log_default(obj):
+    """Dump models kept as-is in agent log when the log is saved."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
 class BaseAgent:
     """Base class for agents."""
 
@@ -47,6 +51,7 @@ class BaseAgent:
         self.id = f"{self.name}_{uuid.uuid4()}"
         self.logger = logging.getLogger(f"{self.id}")
         self.task = task
+        self.creation_time = datetime.now()
         self.toolkit = [*system_agent_tools, *(toolkit or [])]
 
         self._context = ResearchContext()
@@ -55,13 +60,26 @@ class BaseAgent:
         self.max_iterations = max_iterations
         self.max_clarifications = max_clarifications
 
-        client_kwargs = {"base_url": config.openai.base_url, "api_key": config.openai.api_key}
-        if config.openai.proxy.strip():
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=config.openai.proxy)
-
-        self.openai_client = AsyncOpenAI(**client_kwargs)
+        self.openai_client = self._get_openai_client(
+            base_url=config.openai.base_url,
+            api_key=config.openai.api_key,
+            proxy=config.openai.proxy,
+        )
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
 
+    @staticmethod
+    @cache
+    def _get_openai_client(base_url: str, api_key: str, proxy: str) -> AsyncOpenAI:
+        """Get OpenAI client shared by all agents with the same settings.
+
+        Agents reuse one HTTP connection pool instead of opening new
+        connections (and TLS sessions) for every research task.
+        """
+        client_kwargs = {"base_url": base_url, "api_key": api_key}
+        if proxy.strip():
+            client_kwargs["http_client"] = httpx.AsyncClient(proxy=proxy)
+        return AsyncOpenAI(**client_kwargs)
+
     async def provide_clarification(self, clarifications: str):
         """Receive clarification from external source (e.g. user input)"""
         self.conversation.append({"role": "user", "content": f"CLARIFICATIONS: {clarifications}"})
@@ -73,45 +91,57 @@ class BaseAgent:
     def _log_reasoning(self, result: ReasoningTool) -> None:
         next_step = result.remaining_steps[0] if result.remaining_steps else "Completing"
         self.logger.info(
-            f"""
+            """
 ###############################################
 🤖 LLM RESPONSE DEBUG:
-   🧠 Reasoning Steps: {result.reasoning_steps}
-   📊 Current Situation: '{result.current_situation[:400]}...'
-   📋 Plan Status: '{result.plan_status[:400]}...'
-   🔍 Searches Done: {self._context.searches_used}
-   🔍 Clarifications Done: {self._context.clarifications_used}
-   ✅ Enough Data: {result.enough_data}
-   📝 Remaining Steps: {result.remaining_steps}
-   🏁 Task Completed: {result.task_completed}
-   ➡️ Next Step: {next_step}
-###############################################"""
+   🧠 Reasoning Steps: %s
+   📊 Current Situation: '%.400s...'
+   📋 Plan Status: '%.400s...'
+   🔍 Searches Done: %s
+   🔍 Clarifications Done: %s
+   ✅ Enough Data: %s
+   📝 Remaining Steps: %s
+   🏁 Task Completed: %s
+   ➡️ Next Step: %s
+###############################################""",
+            result.reasoning_steps,
+            result.current_situation,
+            result.plan_status,
+            self._context.searches_used,
+            self._context.clarifications_used,
+            result.enough_data,
+            result.remaining_steps,
+            result.task_completed,
+            next_step,
         )
         self.log.append(
             {
                 "step_number": self._context.iteration,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),  # ISO formatted by orjson on save
                 "step_type": "reasoning",
-                "agent_reasoning": result.model_dump(),
+                "agent_reasoning": result,
             }
         )
 
     def _log_tool_execution(self, tool: BaseTool, result: str):
-        self.logger.info(
-            f"""
+        if self.logger.isEnabledFor(logging.INFO):  # don't dump tool model if it won't be logged
+            self.logger.info(
+                """
 ###############################################
 🛠️ TOOL EXECUTION DEBUG:
-   🔧 Tool Name: {tool.tool_name}
-   📋 Tool Model: {tool.model_dump_json(indent=2)}
-###############################################"""
-        )
+   🔧 Tool Name: %s
+   📋 Tool Model: %s
+###############################################""",
+                tool.tool_name,
+                tool.model_dump_json(indent=2),
+            )
         self.log.append(
             {
                 "step_number": self._context.iteration,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),  # ISO formatted by orjson on save
                 "step_type": "tool_execution",
                 "tool_name": tool.tool_name,
-                "agent_tool_context": tool.model_dump(),
+                "agent_tool_context": tool,
                 "agent_tool_execution_result": result,
             }
         )
@@ -127,16 +157,72 @@ class BaseAgent:
             "log": self.log,
         }
 
-        json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(agent_log, default=_agent_log_default, option=orjson.OPT_INDENT_2))
 
     async def _prepare_context(self) -> list[dict]:
         """Prepare conversation context with system prompt."""
         system_prompt = PromptLoader.get_system_prompt(
             sources=list(self._context.sources.values()),
             available_tools=self.toolkit,
+            current_date=self.creation_time,
         )
         return [{"role": "system", "content": system_prompt}, *self.conversation]
 
+    @staticmethod
+    @cache
+    def _function_tool_param(tool: Type[BaseTool]) -> ChatCompletionFunctionToolParam:
+        """Convert tool class to OpenAI function tool param.
+
+        Tool schema never changes, so it is generated once per tool
+        class.
+        """
+        return pydantic_function_tool(tool, name=tool.tool_name, description=tool.description)
+
+    async def _stream_parsed_content(self, stream: AsyncChatCompletionStream) -> BaseModel | None:
+        """Stream response to the client and return parsed response_format.
+
+        The model is taken from the already validated 'content.done'
+        event instead of re-parsing it in get_final_completion().
+        """
+        parsed = None
+        async for event in stream:
+            if event.type == "chunk":
+                self.streaming_generator.add_chunk(event.chunk)
+            elif event.type == "content.done":
+                parsed = event.parsed
+        if parsed is None:
+            # some OpenAI-compatible backends end the stream without finish_reason, so no done events
+            parsed = (await stream.get_final_completion()).choices[0].message.parsed
+        return parsed
+
+    async def _stream_parsed_tool_call(self, stream: AsyncChatCompletionStream) -> BaseModel | None:
+        """Stream response to the client and return parsed first tool call.
+
+        The arguments are taken from the already validated
+        'tool_calls.function.arguments.done' event instead of re-parsing
+        them in get_final_completion().
+        """
+        parsed = None
+        async for event in stream:
+            if event.type == "chunk":
+                self.streaming_generator.add_chunk(event.chunk)
+            elif event.type == "tool_calls.function.arguments.done" and event.index == 0:
+                parsed = event.parsed_arguments
+        if parsed is None:
+            # some OpenAI-compatible backends end the stream without finish_reason, so no done events
+            message = (await stream.get_final_completion()).choices[0].message
+            parsed = message.tool_calls[0].function.parsed_arguments if message.tool_calls else None
+        return parsed
+
+    async def _execute_tool(self, tool: BaseTool) -> str:
+        """Run tool in a worker thread.
+
+        Tools are synchronous (Tavily search, report file writes), so
+        they must not block the event loop.
+        """
+        return await asyncio.to_thread(tool, self._context)
+
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
         raise NotImplementedError("_prepare_tools must be implemented by subclass")
@@ -172,7 +258,7 @@ class BaseAgent:
             ]
         )
         try:
-            while self._context.state not in AgentStatesEnum.FINISH_STATES.value:
+            while self._context.state not in FINISH_STATES:
                 self._context.iteration += 1
                 self.logger.info(f"Step {self._context.iteration} started")
 
@@ -196,4 +282,4 @@ class BaseAgent:
         finally:
             if self.streaming_generator is not None:
                 self.streaming_generator.finish()
-            self._save_agent_log()
+            await asyncio.to_thread(self._save_agent_log)
@@ -72,10 +72,9 @@ class SGRResearchAgent(BaseAgent):
             max_tokens=config.openai.max_tokens,
             temperature=config.openai.temperature,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
-        reasoning: NextStepToolStub = (await stream.get_final_completion()).choices[0].message.parsed  # type: ignore
+            reasoning = await self._stream_parsed_content(stream)
+        if reasoning is None:
+            raise ValueError("LLM response does not contain a valid NextStepTools reasoning")
         # we are not fully sure if it should be in conversation or not. Looks like not necessary data
         # self.conversation.append({"role": "assistant", "content": reasoning.model_dump_json(exclude={"function"})})
         self._log_reasoning(reasoning)
@@ -85,6 +84,7 @@ class SGRResearchAgent(BaseAgent):
         tool = reasoning.function
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -95,19 +95,17 @@ class SGRResearchAgent(BaseAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
 
     async def _action_phase(self, tool: BaseTool) -> str:
-        result = tool(self._context)
+        result = await self._execute_tool(tool)
         self.conversation.append(
             {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
         )
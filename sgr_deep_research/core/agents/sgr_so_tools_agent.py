@@ -12,31 +12,30 @@ class SGRSOToolCallingResearchAgent(SGRToolCallingResearchAgent):
     name: str = "sgr_so_tool_calling_agent"
 
     async def _reasoning_phase(self) -> ReasoningTool:
+        # conversation is not changed between the two requests, so the context is built once
+        messages = await self._prepare_context()
         async with self.openai_client.chat.completions.stream(
             model=config.openai.model,
-            messages=await self._prepare_context(),
+            messages=messages,
             max_tokens=config.openai.max_tokens,
             temperature=config.openai.temperature,
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
+            # only streamed to the client, structured output request below produces the reasoning
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-            reasoning: ReasoningTool = (  # noqa
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
-            )
         async with self.openai_client.chat.completions.stream(
             model=config.openai.model,
             response_format=ReasoningTool,
-            messages=await self._prepare_context(),
+            messages=messages,
             max_tokens=config.openai.max_tokens,
             temperature=config.openai.temperature,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
-        reasoning: ReasoningTool = (await stream.get_final_completion()).choices[0].message.parsed
+            reasoning = await self._stream_parsed_content(stream)
+        if not isinstance(reasoning, ReasoningTool):
+            raise ValueError("LLM response does not contain a valid ReasoningTool")
         tool_call_result = reasoning(self._context)
         self.conversation.append(
             {
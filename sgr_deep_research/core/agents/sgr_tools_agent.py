@@ -1,6 +1,5 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.sgr_agent import SGRResearchAgent
@@ -60,7 +59,7 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools -= {
                 WebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description=tool.description) for tool in tools]
+        return [self._function_tool_param(tool) for tool in tools]
 
     async def _reasoning_phase(self) -> ReasoningTool:
         async with self.openai_client.chat.completions.stream(
@@ -71,13 +70,9 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
-            async for event in stream:
-                # print(event)
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
-            reasoning: ReasoningTool = (  # noqa
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
-            )
+            reasoning = await self._stream_parsed_tool_call(stream)
+        if not isinstance(reasoning, ReasoningTool):
+            raise ValueError("LLM response does not contain a valid ReasoningTool")
         self.conversation.append(
             {
                 "role": "assistant",
@@ -110,13 +105,11 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
-        tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
+            tool = await self._stream_parsed_tool_call(stream)
 
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -127,13 +120,11 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
@@ -1,6 +1,5 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.base_agent import BaseAgent
@@ -62,7 +61,7 @@ class ToolCallingResearchAgent(BaseAgent):
             tools -= {
                 WebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description=tool.description) for tool in tools]
+        return [self._function_tool_param(tool) for tool in tools]
 
     async def _reasoning_phase(self) -> None:
         """No explicit reasoning phase, reasoning is done internally by LLM."""
@@ -77,13 +76,11 @@ class ToolCallingResearchAgent(BaseAgent):
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
-        tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
+            tool = await self._stream_parsed_tool_call(stream)
 
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -94,19 +91,17 @@ class ToolCallingResearchAgent(BaseAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
 
     async def _action_phase(self, tool: BaseTool) -> str:
-        result = tool(self._context)
+        result = await self._execute_tool(tool)
         self.conversation.append(
             {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
         )
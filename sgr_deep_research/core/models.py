@@ -40,7 +40,10 @@ class AgentStatesEnum(str, Enum):
     ERROR = "error"
     FAILED = "failed"
 
-    FINISH_STATES = {COMPLETED, FAILED, ERROR}
+
+FINISH_STATES: frozenset[AgentStatesEnum] = frozenset(
+    {AgentStatesEnum.COMPLETED, AgentStatesEnum.FAILED, AgentStatesEnum.ERROR}
+)
 
 
 class ResearchContext(BaseModel):
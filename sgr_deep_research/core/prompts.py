@@ -27,7 +27,18 @@ class PromptLoader:
         raise FileNotFoundError(f"Prompt file not found: {user_file_path} or {lib_file_path}")
 
     @classmethod
-    def get_system_prompt(cls, sources: list[SourceData], available_tools: list[BaseTool]) -> str:
+    def get_system_prompt(
+        cls,
+        sources: list[SourceData],
+        available_tools: list[BaseTool],
+        current_date: datetime | None = None,
+    ) -> str:
+        """Render system prompt.
+
+        Pass the same current_date for all steps of one research to keep
+        prompt prefix stable between requests (allows LLM provider
+        prompt caching).
+        """
         sources_formatted = "\n".join([str(source) for source in sources])
         template = cls._load_prompt_file(config.prompts.system_prompt_file)
         available_tools_str_list = [
@@ -35,7 +46,7 @@ class PromptLoader:
         ]
         try:
             return template.format(
-                current_date=datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+                current_date=(current_date or datetime.now()).strftime("%d-%m-%Y %H:%M:%S"),
                 date_format="d-m-Y HH:MM:SS",
                 available_tools="\n".join(available_tools_str_list),
                 sources_formatted=sources_formatted,
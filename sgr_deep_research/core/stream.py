@@ -1,7 +1,7 @@
 import asyncio
-import json
 import time
 
+import orjson
 from openai.types.chat import ChatCompletionChunk
 
 
@@ -9,7 +9,7 @@ class StreamingGenerator:
     def __init__(self):
         self.queue = asyncio.Queue()
 
-    def add(self, data: str):
+    def add(self, data: bytes):
         self.queue.put_nowait(data)
 
     def finish(self):
@@ -20,7 +20,13 @@ class StreamingGenerator:
             data = await self.queue.get()
             if data is None:  # Завершающий символ
                 break
-            yield data
+            # Забираем всё, что уже накопилось в очереди, и отдаём одной записью
+            chunks = [data]
+            while not self.queue.empty() and (data := self.queue.get_nowait()) is not None:
+                chunks.append(data)
+            yield b"".join(chunks)
+            if data is None:
+                break
 
 
 class OpenAIStreamingGenerator(StreamingGenerator):
@@ -34,7 +40,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
 
     def add_chunk(self, chunk: ChatCompletionChunk):
         chunk.model = self.model
-        super().add(f"data: {chunk.model_dump_json()}\n\n")
+        super().add(b"data: " + chunk.model_dump_json().encode() + b"\n\n")
 
     def add_chunk_from_str(self, content: str):
         response = {
@@ -53,7 +59,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             ],
             "usage": None,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        super().add(b"data: " + orjson.dumps(response) + b"\n\n")
 
     def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
         """Добавляет tool call chunk."""
@@ -82,7 +88,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             ],
             "usage": None,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        super().add(b"data: " + orjson.dumps(response) + b"\n\n")
 
     def finish(self, finish_reason: str = "stop"):
         """Завершает stream с финальным chunk и usage."""
@@ -95,6 +101,6 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "choices": [{"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": finish_reason}],
             "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
         }
-        super().add(f"data: {json.dumps(final_response)}\n\n")
-        super().add("data: [DONE]\n\n")
+        super().add(b"data: " + orjson.dumps(final_response) + b"\n\n")
+        super().add(b"data: [DONE]\n\n")
         super().finish()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import operator
 from abc import ABC
-from functools import reduce
+from functools import cache, reduce
 from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, Type, TypeVar
 
 from pydantic import BaseModel, Field, create_model
@@ -166,10 +166,16 @@ class NextStepToolsBuilder:
 
     @classmethod
     def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
+        return cls._build_NextStepTools_cached(frozenset(tools_list))
+
+    @classmethod
+    @cache
+    def _build_NextStepTools_cached(cls, tools_set: frozenset[Type[T]]) -> Type[NextStepToolStub]:  # noqa
+        """Create NextStepTools model once per distinct tool set."""
         return create_model(
             "NextStepTools",
             __base__=NextStepToolStub,
-            function=(cls._create_tool_types_union(tools_list), Field()),
+            function=(cls._create_tool_types_union(list(tools_set)), Field()),
         )
 
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 
+import orjson
 from pydantic import Field
 
 from sgr_deep_research.core.models import SearchResult
@@ -20,6 +22,17 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 config = get_config()
 
+# Characters not allowed in report filenames (keeps letters, digits, space, "-" and "_")
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+# Report directories already created by this process
+_created_reports_dirs: set[str] = set()
+
+
+@cache
+def _get_search_service() -> TavilySearchService:
+    """Shared search service: tools are instantiated on every LLM tool call."""
+    return TavilySearchService()
+
 
 class CreateReportTool(BaseTool):
     """Create comprehensive detailed report with citations as a final step of
@@ -39,17 +52,25 @@ class CreateReportTool(BaseTool):
     def __call__(self, context: ResearchContext) -> str:
         # Save report
         reports_dir = config.execution.reports_dir
-        os.makedirs(reports_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(c for c in self.title if c.isalnum() or c in (" ", "-", "_"))[:50]
+        if reports_dir not in _created_reports_dirs:
+            os.makedirs(reports_dir, exist_ok=True)
+            _created_reports_dirs.add(reports_dir)
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("", self.title)[:50]
         filename = f"{timestamp}_{safe_title}.md"
         filepath = os.path.join(reports_dir, filename)
 
         # Format full report with sources
-        full_content = f"# {self.title}\n\n"
-        full_content += f"*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
-        full_content += self.content + "\n\n"
-        full_content += "\n".join(["- " + str(source) for source in context.sources.values()])
+        full_content = "".join(
+            [
+                f"# {self.title}\n\n",
+                f"*Created: {now.strftime('%Y-%m-%d %H:%M:%S')}*\n\n",
+                self.content,
+                "\n\n",
+                "\n".join(["- " + str(source) for source in context.sources.values()]),
+            ]
+        )
 
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(full_content)
@@ -61,7 +82,7 @@ class CreateReportTool(BaseTool):
             "sources_count": len(context.sources),
             "word_count": len(self.content.split()),
             "filepath": filepath,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         logger.info(
             "📝 CREATE REPORT FULL DEBUG:\n"
@@ -73,7 +94,7 @@ class CreateReportTool(BaseTool):
             f"   📊 Words: {report['word_count']}, Sources: {report['sources_count']}\n"
             f"   💾 Saved: {filepath}\n"
         )
-        return json.dumps(report, indent=2, ensure_ascii=False)
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
 
 
 class WebSearchTool(BaseTool):
@@ -96,7 +117,7 @@ class WebSearchTool(BaseTool):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._search_service = TavilySearchService()
+        self._search_service = _get_search_service()
 
     def __call__(self, context: ResearchContext) -> str:
         """Execute web search using TavilySearchService."""
@@ -121,22 +142,23 @@ class WebSearchTool(BaseTool):
         )
         context.searches.append(search_result)
 
-        formatted_result = f"Search Query: {search_result.query}\n\n"
+        parts = [f"Search Query: {search_result.query}\n\n"]
 
         if search_result.answer:
-            formatted_result += f"AI Answer: {search_result.answer}\n\n"
+            parts.append(f"AI Answer: {search_result.answer}\n\n")
 
-        formatted_result += "Search Results:\n\n"
+        parts.append("Search Results:\n\n")
 
         for source in sources:
             if source.full_content:
-                formatted_result += (
+                parts.append(
                     f"{str(source)}\n\n**Full Content (Markdown):**\n"
                     f"{source.full_content[: config.scraping.content_limit]}\n\n"
                 )
             else:
-                formatted_result += f"{str(source)}\n{source.snippet}\n\n"
+                parts.append(f"{str(source)}\n{source.snippet}\n\n")
 
+        formatted_result = "".join(parts)
         context.searches_used += 1
         logger.debug(formatted_result)
         return formatted_result